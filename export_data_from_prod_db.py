@@ -24,12 +24,17 @@ Behavior:
 import os
 import sys
 import threading
+import time
+import queue
+import tempfile
+import shutil
 import io
 import math
 import sqlite3
 import mysql.connector
 import json
-from mysql.connector import Error
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from mysql.connector import Error, FieldType
 from dotenv import load_dotenv
 import customtkinter as ctk
 import tkinter as tk
@@ -58,8 +63,34 @@ TABLE_FILTERS = {
 # Default local DB file name
 LOCAL_DB_NAME = "prod_database_local_copy.db"
 
+# MySQL column types that can back a SQLite INTEGER PRIMARY KEY (rowid alias)
+MYSQL_INTEGER_TYPES = {"tinyint", "smallint", "mediumint", "int", "bigint"}
+
 # Chunk size for fetching/inserting rows
-CHUNK_SIZE = 1000
+CHUNK_SIZE = 10_000
+
+# Chunks buffered between the MySQL reader thread and the SQLite writer (bounds memory to ~N*CHUNK_SIZE rows)
+CHUNK_QUEUE_SIZE = 4
+
+# Tables exported at the same time (each worker opens its own MySQL connection)
+MAX_PARALLEL_EXPORTS = 4
+
+# Minimum seconds between progress reports from one table export
+PROGRESS_INTERVAL = 0.2
+
+# How long (ms) a SQLite connection waits on a locked database before giving up
+SQLITE_BUSY_TIMEOUT_MS = 60000
+
+# How often (ms) the GUI applies queued progress updates from the export threads
+PROGRESS_POLL_MS = 100
+
+# Stage each table in a temp file next to the destination before copying it into the .db file.
+# True stages in RAM instead -- only for small exports: up to MAX_PARALLEL_EXPORTS whole
+# tables are then held in memory at once.
+STAGING_IN_MEMORY = False
+
+# Seconds to wait for the MySQL (RDS) connection before giving up
+MYSQL_CONNECT_TIMEOUT = 30
 
 # ---- END CONFIG ----
 
@@ -90,7 +121,12 @@ else:
 # ---------------- MySQL <> SQLite logic ----------------
 
 def get_mysql_connection():
-    """Return a MySQL connection using creds from .env. Raises on failure."""
+    """
+    Return a MySQL connection using creds from .env. Raises on failure.
+    The export only reads, so the session runs in autocommit with READ COMMITTED:
+    no long implicit transaction holds an InnoDB read view (and undo history) open
+    across tables while the prod primary keeps taking writes.
+    """
     if not all([DB_HOST, DB_USER, DB_PASSWORD, DB_NAME]):
         raise RuntimeError("Missing database credentials. Ensure DB_HOST, DB_USER, DB_PASSWORD, DB_NAME are set in .env")
     conn = mysql.connector.connect(
@@ -101,26 +137,72 @@ def get_mysql_connection():
         port=DB_PORT,
         charset='utf8mb4',
         use_unicode=True,
-        autocommit=False
+        autocommit=True,
+        init_command="SET SESSION TRANSACTION ISOLATION LEVEL READ COMMITTED",
+        connection_timeout=MYSQL_CONNECT_TIMEOUT
     )
     return conn
 
-def fetch_table_count(mysql_conn, table):
+def fetch_table_count(mysql_conn, table, where_clause=""):
+    """Exact row count of a table, optionally limited by a WHERE clause (" WHERE ..." as in TABLE_FILTERS)."""
     cur = mysql_conn.cursor()
-    cur.execute(f"SELECT COUNT(*) FROM `{table}`")
+    cur.execute(f"SELECT COUNT(*) FROM `{table}`{where_clause}")
     count = cur.fetchone()[0]
     cur.close()
     return count
 
-def get_table_columns(mysql_conn, table):
+def fetch_table_row_estimate(mysql_conn, table):
     """
-    Return the list of columns we should export for a table.
-    Uses table_fields.json if provided.
+    Return InnoDB's row estimate for a table from information_schema (no table scan).
+    Only good enough for progress display -- it can be off in either direction.
     """
     cur = mysql_conn.cursor()
-    cur.execute(f"SHOW COLUMNS FROM `{table}`")
-    all_columns = [row[0] for row in cur.fetchall()]
+    cur.execute(
+        "SELECT TABLE_ROWS FROM information_schema.tables WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s",
+        (DB_NAME, table)
+    )
+    row = cur.fetchone()
     cur.close()
+    return row[0] if row and row[0] else 0
+
+def fetch_table_metadata(mysql_conn, tables):
+    """
+    Return (table_columns, integer_pks) for all given tables with one information_schema
+    query instead of a SHOW COLUMNS round-trip per table.
+    table_columns: {table: [columns in table order]}
+    integer_pks: {table: column} for tables whose primary key is a single integer column
+    """
+    placeholders = ", ".join(["%s"] * len(tables))
+    cur = mysql_conn.cursor()
+    cur.execute(
+        "SELECT TABLE_NAME, COLUMN_NAME, COLUMN_KEY, DATA_TYPE FROM information_schema.columns "
+        f"WHERE TABLE_SCHEMA = %s AND TABLE_NAME IN ({placeholders}) "
+        "ORDER BY TABLE_NAME, ORDINAL_POSITION",
+        (DB_NAME, *tables)
+    )
+    table_columns = {}
+    pk_columns = {}
+    for table, column, column_key, data_type in cur.fetchall():
+        table_columns.setdefault(table, []).append(column)
+        if column_key == "PRI":
+            pk_columns.setdefault(table, []).append((column, data_type))
+    cur.close()
+
+    integer_pks = {
+        table: cols[0][0] for table, cols in pk_columns.items()
+        if len(cols) == 1 and cols[0][1].lower() in MYSQL_INTEGER_TYPES
+    }
+    return table_columns, integer_pks
+
+def get_table_columns(table, table_columns):
+    """
+    Return the list of columns we should export for a table.
+    Uses table_fields.json if provided.
+    table_columns is the {table: [columns]} map from fetch_table_metadata.
+    """
+    if table not in table_columns:
+        raise RuntimeError(f"Table `{table}` not found in database `{DB_NAME}`")
+    all_columns = table_columns[table]
 
     # If JSON defines fields for this table → use them
     if table in TABLE_FIELDS:
@@ -131,89 +213,404 @@ def get_table_columns(mysql_conn, table):
     # Otherwise → export ALL columns
     return all_columns
 
-def recreate_sqlite_table(sqlite_conn, table, columns):
+def recreate_sqlite_table(sqlite_conn, table, columns, integer_pk=None):
     """
     Create (or replace) a table in SQLite with the provided column names.
-    All columns created as TEXT to avoid type mismatches (SQLite is dynamic-typed).
+    All columns created as TEXT to avoid type mismatches (SQLite is dynamic-typed),
+    except integer_pk: declared INTEGER PRIMARY KEY, it becomes the rowid itself, so
+    inserts reuse the MySQL id instead of assigning a separate hidden rowid.
+    No other keys or indexes are created, so nothing slows down the bulk insert.
     """
     cur = sqlite_conn.cursor()
     cur.execute("PRAGMA foreign_keys = OFF;")
     sqlite_conn.commit()
     # safe name quoting
-    col_defs = ", ".join([f"'{c}' TEXT" for c in columns])
+    col_defs = ", ".join([f"'{c}' INTEGER PRIMARY KEY" if c == integer_pk else f"'{c}' TEXT" for c in columns])
     # drop and create to ensure replace/refresh behavior
     cur.execute(f"DROP TABLE IF EXISTS '{table}'")
     cur.execute(f"CREATE TABLE '{table}' ({col_defs});")
     sqlite_conn.commit()
     cur.close()
 
-def export_table(mysql_conn, sqlite_conn, table, progress_callback=None, offset_progress=0.0, table_weight=1.0):
+# MySQL collation id of the `binary` charset: columns in it are returned as bytes
+BINARY_CHARSET_ID = 63
+
+def get_binary_column_indexes(description):
+    """
+    Return the indexes of result columns the connector hands back as bytes
+    (BINARY / VARBINARY / BLOB), based on the cursor description.
+    Same test as the connector: a string/blob column in the binary charset (63).
+    Text columns -- including *_bin collations -- already arrive as str thanks to use_unicode=True.
+    """
+    string_types = FieldType.get_string_types() + FieldType.get_binary_types()
+    return [
+        i for i, col in enumerate(description)
+        if col[1] in string_types and col[8] == BINARY_CHARSET_ID
+    ]
+
+def decode_binary_columns(row, indexes):
+    """Decode the given bytes columns of a row to str (all SQLite columns are TEXT)."""
+    row = list(row)
+    for i in indexes:
+        v = row[i]
+        if isinstance(v, (bytes, bytearray)):
+            row[i] = v.decode('utf-8', errors='replace')
+    return row
+
+class BulkInserter:
+    """
+    Writes chunks of rows into one table, with three knobs:
+    bulk_size   -- rows per INSERT statement (multi-row VALUES when > 1)
+    batch_size  -- INSERT statements sent per executemany call
+    commit_size -- INSERT statements per transaction (None = one transaction for the whole load)
+    The defaults are the SQLite export's: bulk_size=1, batch_size=CHUNK_SIZE, commit_size=None.
+    A MySQL target would use placeholder="%s", begin_sql="START TRANSACTION" and e.g.
+    bulk_size=1000, batch_size=10, commit_size=100.
+    """
+
+    def __init__(self, conn, table, columns, bulk_size=1, batch_size=CHUNK_SIZE, commit_size=None,
+                 placeholder="?", begin_sql="BEGIN IMMEDIATE"):
+        self.conn = conn
+        self.cur = conn.cursor()
+        self.table = table
+        self.columns = columns
+        self.bulk_size = bulk_size
+        self.batch_size = batch_size
+        self.commit_size = commit_size
+        self.placeholder = placeholder
+        self.begin_sql = begin_sql
+        self.pending = 0  # statements executed since the last commit
+        self.insert_sql = self.build_insert_sql(bulk_size)
+
+    def build_insert_sql(self, row_count):
+        """INSERT statement with `row_count` VALUES tuples (backtick quoting works in SQLite and MySQL)."""
+        row_placeholders = "(" + ", ".join([self.placeholder] * len(self.columns)) + ")"
+        return (
+            f"INSERT INTO `{self.table}` ({', '.join(['`'+c+'`' for c in self.columns])}) "
+            f"VALUES {', '.join([row_placeholders] * row_count)}"
+        )
+
+    def begin(self):
+        # called once before the first insert() and again after every intermediate commit
+        self.cur.execute(self.begin_sql)
+
+    def insert(self, rows):
+        """Insert a chunk of rows (a list of tuples/lists), committing every commit_size statements."""
+        if self.bulk_size == 1:
+            self.execute_statements(self.insert_sql, rows)
+            return
+        # flatten bulk_size rows into the parameters of one multi-row INSERT
+        full = len(rows) - len(rows) % self.bulk_size
+        self.execute_statements(self.insert_sql, [
+            [v for row in rows[i:i + self.bulk_size] for v in row]
+            for i in range(0, full, self.bulk_size)
+        ])
+        if full < len(rows):
+            tail = rows[full:]
+            self.execute_statements(self.build_insert_sql(len(tail)), [[v for row in tail for v in row]])
+
+    def execute_statements(self, sql, statements):
+        """Run `sql` for each parameter set, batch_size per executemany call."""
+        if len(statements) <= self.batch_size:
+            batches = [statements]  # no slicing copy in the common one-call-per-chunk case
+        else:
+            batches = (statements[i:i + self.batch_size] for i in range(0, len(statements), self.batch_size))
+        for batch in batches:
+            self.cur.executemany(sql, batch)
+            self.pending += len(batch)
+            if self.commit_size is not None and self.pending >= self.commit_size:
+                self.conn.commit()
+                self.pending = 0
+                self.begin()
+
+    def commit(self):
+        self.conn.commit()
+        self.pending = 0
+
+    def rollback(self):
+        self.conn.rollback()
+        self.pending = 0
+
+    def close(self):
+        self.cur.close()
+
+def put_chunk(chunk_queue, item, stop_event):
+    """Put item on the bounded queue; give up (return False) once the consumer has set stop_event."""
+    while not stop_event.is_set():
+        try:
+            chunk_queue.put(item, timeout=0.2)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+def fetch_chunks(mysql_cur, chunk_queue, stop_event, binary_cols=(), cancel_event=None):
+    """
+    Producer side of export_table, run on its own thread.
+    Fetches CHUNK_SIZE rows at a time from the executed MySQL cursor and queues them,
+    then a None sentinel. A fetch error is queued instead so the consumer can re-raise it.
+    Bytes in binary_cols are decoded here, so queued chunks are ready for executemany as-is.
+    cancel_event (shared by all parallel exports) stops the fetch with an error, never a sentinel,
+    so a cancelled table is not committed half-read.
+    """
+    try:
+        while not stop_event.is_set():
+            if cancel_event is not None and cancel_event.is_set():
+                raise RuntimeError("Export cancelled")
+            rows = mysql_cur.fetchmany(CHUNK_SIZE)
+            if not rows:
+                break
+            if binary_cols:
+                rows = [decode_binary_columns(r, binary_cols) for r in rows]
+            if not put_chunk(chunk_queue, rows, stop_event):
+                return
+        put_chunk(chunk_queue, None, stop_event)
+    except Exception as e:
+        put_chunk(chunk_queue, e, stop_event)
+
+def export_table(mysql_conn, sqlite_conn, table, progress_callback=None, offset_progress=0.0, table_weight=1.0, table_columns=None, integer_pks=None, cancel_event=None):
     """
     Export one table from MySQL to SQLite.
     progress_callback(fraction, message) -- fraction is 0..1 for the whole export run.
     offset_progress & table_weight let caller incorporate this table's progress into overall progress.
+    table_columns & integer_pks are the metadata maps from fetch_table_metadata
+    (looked up for this table alone when not given).
+    cancel_event, when set (e.g. another parallel table failed), aborts the export and rolls it back.
     """
-    mysql_cur = mysql_conn.cursor(buffered=True)
-    # get total rows
+    # Optional WHERE condition
+    where_clause = ""
+    if table in TABLE_FILTERS:
+        where_clause = f" WHERE {TABLE_FILTERS[table]}"
+
+    # total rows, for progress. Filtered tables get an exact count of the matching rows
+    # (the filters are selective); the others only InnoDB's estimate, to avoid a full scan.
+    # 0/None = unknown: progress is then reported as a running row count.
+    total_rows = None
     try:
-        total_rows = fetch_table_count(mysql_conn, table)
+        if where_clause:
+            total_rows = fetch_table_count(mysql_conn, table, where_clause)
+        else:
+            total_rows = fetch_table_row_estimate(mysql_conn, table)
     except Exception:
-        total_rows = 0
+        total_rows = None
+    total_label = f"{total_rows}" if where_clause else f"~{total_rows}"
 
-    columns = get_table_columns(mysql_conn, table)
-    recreate_sqlite_table(sqlite_conn, table, columns)
+    if table_columns is None:
+        table_columns, integer_pks = fetch_table_metadata(mysql_conn, [table])
+    columns = get_table_columns(table, table_columns)
+    recreate_sqlite_table(sqlite_conn, table, columns, (integer_pks or {}).get(table))
 
-    if total_rows == 0:
-        # nothing to do but notify
+    if where_clause and total_rows == 0:
+        # the filter matches nothing: keep the empty table and skip the SELECT round-trip
         if progress_callback:
             progress_callback(offset_progress + table_weight, f"{table} (0 rows)")
-        mysql_cur.close()
         return
 
-    # prepare insert statement in sqlite
-    placeholders = ", ".join(["?"] * len(columns))
-    insert_sql = f"INSERT INTO '{table}' ({', '.join(['`'+c+'`' for c in columns])}) VALUES ({placeholders})"
+    # one executemany per chunk, one transaction for the whole table:
+    # a commit per chunk would force a sync every CHUNK_SIZE rows
+    inserter = BulkInserter(sqlite_conn, table, columns, bulk_size=1, batch_size=CHUNK_SIZE, commit_size=None)
 
     # fetch in chunks
-    # Optional WHERE condition
-    where_clause = ""
-    if table in TABLE_FILTERS:
-        where_clause = f" WHERE {TABLE_FILTERS[table]}"
-
     select_sql = (
         f"SELECT {', '.join(['`'+c+'`' for c in columns])} "
         f"FROM `{table}`{where_clause}"
     )
+    # unbuffered cursor streams rows as we fetch them instead of loading the whole table into RAM.
+    # opened only after the metadata cursors are closed, since the connection can't run
+    # another query while this result set is unread.
+    mysql_cur = mysql_conn.cursor()
     mysql_cur.execute(select_sql)
-    sqlite_cur = sqlite_conn.cursor()
+    binary_cols = get_binary_column_indexes(mysql_cur.description)
 
     rows_inserted = 0
-    batch = []
+    last_tick = 0.0
+
+    # MySQL fetches run on a reader thread so network transfer overlaps the SQLite inserts.
+    # All SQLite I/O stays on this thread (the connection belongs to it).
+    chunk_queue = queue.Queue(maxsize=CHUNK_QUEUE_SIZE)
+    stop_event = threading.Event()
+    reader = threading.Thread(target=fetch_chunks, args=(mysql_cur, chunk_queue, stop_event, binary_cols, cancel_event), daemon=True)
+
+    # IMMEDIATE takes the write lock up front, so lock waits happen here and not mid-table
+    inserter.begin()
+    reader.start()
+    failed = False
+    try:
+        while True:
+            rows = chunk_queue.get()
+            if rows is None:
+                break
+            if isinstance(rows, Exception):
+                raise rows
+            if cancel_event is not None and cancel_event.is_set():
+                raise RuntimeError("Export cancelled")
+
+            # chunks arrive as ready-to-bind rows: no per-row work on the writer side
+            inserter.insert(rows)
+
+            # Update progress once per chunk, at most every PROGRESS_INTERVAL seconds
+            rows_inserted += len(rows)
+            now = time.monotonic()
+            if progress_callback and now - last_tick >= PROGRESS_INTERVAL:
+                last_tick = now
+                if total_rows:
+                    # an estimate can be low, so never run past this table's share
+                    table_progress = min(rows_inserted / total_rows, 1.0)
+                    overall_fraction = offset_progress + table_weight * table_progress
+                    progress_callback(overall_fraction, f"{table}: {rows_inserted}/{total_label} rows ({table_progress*100:.1f}%)")
+                else:
+                    progress_callback(offset_progress, f"{table}: {rows_inserted} rows")
+
+        inserter.commit()
+        if progress_callback:
+            progress_callback(offset_progress + table_weight, f"{table}: {rows_inserted} rows")
+    except Exception:
+        failed = True
+        inserter.rollback()
+        raise
+    finally:
+        stop_event.set()
+        reader.join()
+        inserter.close()
+        try:
+            mysql_cur.close()
+        except Exception:
+            # closing a half-read unbuffered cursor raises "Unread result found"; don't let
+            # that replace the real error (the caller discards the connection after a failure)
+            if not failed:
+                raise
 
-    while True:
-        rows = mysql_cur.fetchmany(CHUNK_SIZE)
-        if not rows:
-            break
+def staging_db_name(table, staging_dir=None):
+    """
+    Name of the staging db a worker exports `table` into: the URI of a named shared-cache
+    in-memory db (so the destination connection can ATTACH it), or a plain file path in
+    staging_dir. File stages are never turned into URIs: a network-share path (//server/share/...)
+    becomes file://server/... which SQLite rejects as an invalid URI authority.
+    """
+    if staging_dir is None:
+        return f"file:staging_{table}?mode=memory&cache=shared"
+    return os.path.join(staging_dir, f"{table}.db")
 
-        batch = []
-        for r in rows:
-            # convert bytes to str if needed
-            converted = [v.decode('utf-8', errors='replace') if isinstance(v, (bytes, bytearray)) else v for v in r]
-            batch.append(tuple(converted))
+# each export worker thread keeps one MySQL connection for all the tables it exports
+worker_local = threading.local()
 
-        sqlite_cur.executemany(insert_sql, batch)
-        sqlite_conn.commit()
+def get_worker_mysql_connection(worker_connections):
+    """
+    Return the calling worker thread's MySQL connection, connecting on first use.
+    New connections are also appended to worker_connections, so the caller can close
+    them all once the thread pool has shut down.
+    """
+    conn = getattr(worker_local, "mysql_conn", None)
+    if conn is None:
+        conn = get_mysql_connection()
+        worker_local.mysql_conn = conn
+        worker_connections.append(conn)
+    return conn
 
-        # Update row-level progress
-        for _ in batch:
-            rows_inserted += 1
-            if progress_callback and rows_inserted % 50 == 0:  # update every 50 rows
-                table_progress = rows_inserted / total_rows
-                overall_fraction = offset_progress + table_weight * table_progress
-                progress_callback(overall_fraction, f"{table}: {rows_inserted}/{total_rows} rows ({table_progress*100:.1f}%)")
+def discard_worker_mysql_connection():
+    """Close and forget the calling worker thread's MySQL connection."""
+    conn = getattr(worker_local, "mysql_conn", None)
+    worker_local.mysql_conn = None
+    if conn is not None:
+        close_mysql_connection(conn)
 
+def close_mysql_connection(conn):
+    """Close a MySQL connection, ignoring errors (it may be half-read or already closed)."""
+    try:
+        conn.close()
+    except Exception:
+        pass
 
-    mysql_cur.close()
+def export_table_to_staging(table, staging_db, worker_connections, progress_callback=None, offset_progress=0.0, table_weight=1.0, table_columns=None, integer_pks=None, cancel_event=None):
+    """
+    Export one table into its own staging SQLite db over the worker thread's MySQL connection
+    (see get_worker_mysql_connection; worker_connections collects them for closing).
+    Run by the parallel export workers so they never contend for the destination db.
+    With STAGING_IN_MEMORY the open staging connection is returned -- an in-memory db only
+    lives while it is open, so the caller closes it once the table is merged. File stages
+    are closed here (releasing the exclusive lock) and None is returned.
+    """
+    mysql_conn = get_worker_mysql_connection(worker_connections)
+    # handed back to the merging thread, hence check_same_thread=False (never used concurrently)
+    staging_conn = sqlite3.connect(staging_db, uri=staging_db.startswith("file:"), isolation_level=None, check_same_thread=False)
+    try:
+        configure_sqlite_for_bulk_load(staging_conn)
+        export_table(mysql_conn, staging_conn, table, progress_callback=progress_callback, offset_progress=offset_progress, table_weight=table_weight, table_columns=table_columns, integer_pks=integer_pks, cancel_event=cancel_event)
+    except Exception:
+        staging_conn.close()
+        # the connection may still hold a half-read result set: never reuse it for another table
+        discard_worker_mysql_connection()
+        raise
+    if STAGING_IN_MEMORY:
+        return staging_conn
+    staging_conn.close()
+    return None
+
+def merge_staging_table(sqlite_conn, table, staging_db):
+    """
+    Replace `table` in the destination SQLite db with the copy in a worker's staging db.
+    The table is dropped, recreated from the staging schema and filled with one INSERT ... SELECT.
+    staging_db is a file path, or an in-memory URI -- which sqlite_conn can only ATTACH
+    if it was opened with uri=True.
+    """
+    sqlite_conn.execute("ATTACH DATABASE ? AS staging", (staging_db,))
+    try:
+        create_sql = sqlite_conn.execute(
+            "SELECT sql FROM staging.sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).fetchone()[0]
+        sqlite_conn.execute("BEGIN IMMEDIATE")
+        try:
+            sqlite_conn.execute(f"DROP TABLE IF EXISTS main.'{table}'")
+            sqlite_conn.execute(create_sql)
+            sqlite_conn.execute(f"INSERT INTO main.'{table}' SELECT * FROM staging.'{table}'")
+            sqlite_conn.commit()
+        except Exception:
+            sqlite_conn.rollback()
+            raise
+    finally:
+        sqlite_conn.execute("DETACH DATABASE staging")
+
+def configure_sqlite_for_bulk_load(conn):
+    """
+    Tune a freshly opened staging SQLite connection for a one-shot bulk load.
+    No journal and no fsync: a staging db is thrown away after its table is merged,
+    so a crash mid-export only costs a re-run. Never use this on the destination db.
+    """
+    # wait for a lock held elsewhere (e.g. a DB browser) instead of failing with "database is locked"
+    conn.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS};")
+    # page_size only takes effect before the first table is created in a new file
+    conn.execute("PRAGMA page_size=32768;")
+    conn.execute("PRAGMA journal_mode=OFF;")
+    conn.execute("PRAGMA synchronous=OFF;")
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    # 256 MB page cache shared by the parallel workers (each staging connection gets its slice)
+    conn.execute(f"PRAGMA cache_size=-{262144 // MAX_PARALLEL_EXPORTS};")
+    conn.execute("PRAGMA locking_mode=EXCLUSIVE;")
+
+def configure_sqlite_destination(conn):
+    """
+    Configure the connection to the destination .db file. It keeps the tables that
+    were not selected, so it gets a real journal: the per-table merges are atomic and
+    an interrupted run leaves the file intact.
+    """
+    conn.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS};")
+    conn.execute("PRAGMA journal_mode=WAL;")
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.execute("PRAGMA temp_store=MEMORY;")
+
+def remove_staging_dir(staging_dir):
+    """Delete a staging folder. Returns its path if it could not be (fully) removed, else None."""
+    try:
+        shutil.rmtree(staging_dir)
+    except OSError:
+        return staging_dir
+    return None
+
+def staging_leftover_note(leftover_staging_dir):
+    """Message suffix telling the user about a staging folder that could not be deleted."""
+    if not leftover_staging_dir:
+        return ""
+    return f"\n\nCould not delete the temporary staging folder, please delete it manually:\n{leftover_staging_dir}"
 
 def hide_sqlite_aux_files(db_path):
     """
@@ -351,6 +748,10 @@ class RdsExportUI(ctk.CTk):
         self.credit_label.place(relx=1.0, x=-10, y=1, anchor="ne") 
         self.credit_label.bind("<Button-1>", lambda e: self.open_url("https://github.com/dyoliya"))
 
+        # progress updates from worker threads, applied on the Tk main loop
+        self.progress_queue = queue.Queue()
+        self.after(PROGRESS_POLL_MS, self._drain_progress_queue)
+
         # Helper function
     def open_url(self, url):
         import webbrowser
@@ -402,17 +803,29 @@ class RdsExportUI(ctk.CTk):
         self.message_label.configure(text="Starting export...")
         threading.Thread(target=self._export_worker, daemon=True).start()
 
-    # progress_callback used by export functions
+    # progress_callback used by export functions (called from worker threads)
     def progress_callback(self, fraction, message=None):
-        # fraction 0..1
+        # fraction 0..1; Tk widgets are only touched from the main loop
+        self.progress_queue.put((fraction, message))
+
+    def _drain_progress_queue(self):
+        # apply only the latest queued fraction/message, at most every PROGRESS_POLL_MS
+        fraction, message = None, None
+        try:
+            while True:
+                fraction, latest_message = self.progress_queue.get_nowait()
+                if latest_message:
+                    message = latest_message
+        except queue.Empty:
+            pass
         try:
-            self.progress.set(fraction)
+            if fraction is not None:
+                self.progress.set(fraction)
             if message:
                 self.message_label.configure(text=message)
-            # ensure GUI updates
-            self.update_idletasks()
         except Exception:
             pass  # ignore GUI update issues
+        self.after(PROGRESS_POLL_MS, self._drain_progress_queue)
 
     def _export_worker(self):
         # gather selected tables
@@ -422,7 +835,7 @@ class RdsExportUI(ctk.CTk):
             self.run_btn.configure(state="normal")
             return
 
-        # connect to mysql
+        # connect to mysql (checks the credentials and reads the table metadata before any worker starts)
         try:
             self.progress_callback(0.02, "Connecting to MySQL...")
             mysql_conn = get_mysql_connection()
@@ -434,9 +847,10 @@ class RdsExportUI(ctk.CTk):
 
         # open/create sqlite
         try:
-            sqlite_conn = sqlite3.connect(self.selected_db_path, detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES)
-            sqlite_conn.execute("PRAGMA journal_mode=WAL;")
-            sqlite_conn.execute("PRAGMA synchronous=NORMAL;")
+            # isolation_level=None: transactions are opened explicitly with BEGIN IMMEDIATE
+            # uri=True: lets it ATTACH in-memory staging dbs by URI (plain paths still work)
+            sqlite_conn = sqlite3.connect(self.selected_db_path, detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES, isolation_level=None, uri=True)
+            configure_sqlite_destination(sqlite_conn)
         except Exception as e:
             messagebox.showerror("SQLite error", f"Failed to open/create SQLite DB:\n{e}")
             mysql_conn.close()
@@ -447,22 +861,74 @@ class RdsExportUI(ctk.CTk):
         n = len(selected_tables)
         per_table_weight = 1.0 / n if n else 1.0
 
+        # workers report their own table's (weighted) progress; overall progress is the sum
+        progress_lock = threading.Lock()
+        table_fractions = {t: 0.0 for t in selected_tables}
+
+        def table_progress_callback(table):
+            def callback(fraction, message=None):
+                with progress_lock:
+                    table_fractions[table] = fraction
+                    overall_fraction = sum(table_fractions.values())
+                self.progress_callback(overall_fraction, message)
+            return callback
+
+        leftover_staging_dir = None
         try:
-            tables_done = 0
-            for t in selected_tables:
-                offset = per_table_weight * tables_done
-                self.progress_callback(offset, f"Preparing to export {t}...")
-                export_table(mysql_conn, sqlite_conn, t, progress_callback=self.progress_callback, offset_progress=offset, table_weight=per_table_weight)
-                tables_done += 1
+            self.progress_callback(0.0, f"Preparing to export {n} table(s)...")
+            # column lists and integer primary keys for every selected table in a single metadata query
+            table_columns, integer_pks = fetch_table_metadata(mysql_conn, selected_tables)
+            # the workers use their own connections from here on
+            mysql_conn.close()
+            # each worker exports one table into its own staging db: a temp folder of files next
+            # to the destination, or in-memory dbs when STAGING_IN_MEMORY is on
+            staging_dir = None
+            if not STAGING_IN_MEMORY:
+                staging_dir = tempfile.mkdtemp(dir=os.path.dirname(self.selected_db_path))
+            executor = ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_EXPORTS, n))
+            futures = {}
+            worker_connections = []
+            # set on the first failure so running workers stop streaming their tables
+            cancel_event = threading.Event()
+            try:
+                for t in selected_tables:
+                    staging_db = staging_db_name(t, staging_dir)
+                    future = executor.submit(export_table_to_staging, t, staging_db, worker_connections, progress_callback=table_progress_callback(t), table_weight=per_table_weight, table_columns=table_columns, integer_pks=integer_pks, cancel_event=cancel_event)
+                    futures[future] = (t, staging_db)
+
+                # copy each table into the destination db as soon as its worker finishes,
+                # then close the staging db to free its memory
+                for future in as_completed(futures):
+                    staging_conn = future.result()
+                    t, staging_db = futures[future]
+                    try:
+                        merge_staging_table(sqlite_conn, t, staging_db)
+                    finally:
+                        if staging_conn is not None:
+                            staging_conn.close()
+            except Exception:
+                cancel_event.set()
+                raise
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+                for conn in worker_connections:
+                    close_mysql_connection(conn)
+                # release staging dbs of workers that finished after a failure
+                for future in futures:
+                    if not future.cancelled() and future.exception() is None and future.result() is not None:
+                        future.result().close()
+                if staging_dir is not None:
+                    # can hold full table copies (GBs): report it if it could not be deleted
+                    leftover_staging_dir = remove_staging_dir(staging_dir)
             # final commit and close
             sqlite_conn.commit()
             sqlite_conn.close()
-            mysql_conn.close()
-            hide_sqlite_aux_files(self.selected_db_path) # hide WAL/SHM files
-            self.progress_callback(1.0, f"Export complete. Local DB saved at:\n{self.selected_db_path}")
+            hide_sqlite_aux_files(self.selected_db_path) # hide WAL/SHM files the destination may leave behind
+            leftover_note = staging_leftover_note(leftover_staging_dir)
+            self.progress_callback(1.0, f"Export complete. Local DB saved at:\n{self.selected_db_path}{leftover_note}")
             
             def ask_open_folder():
-                if messagebox.askyesno("Done", "Export finished!\nOpen output folder?"):
+                if messagebox.askyesno("Done", f"Export finished!{leftover_note}\nOpen output folder?"):
                     output_folder = os.path.dirname(self.selected_db_path)
                     if not os.path.exists(output_folder):
                         os.makedirs(output_folder)
@@ -479,8 +945,9 @@ class RdsExportUI(ctk.CTk):
                 mysql_conn.close()
             except:
                 pass
-            self.progress_callback(0.0, f"Export failed: {e}")
-            messagebox.showerror("Export failed", f"An error occurred during export:\n{e}")
+            leftover_note = staging_leftover_note(leftover_staging_dir)
+            self.progress_callback(0.0, f"Export failed: {e}{leftover_note}")
+            messagebox.showerror("Export failed", f"An error occurred during export:\n{e}{leftover_note}")
         finally:
             self.run_btn.configure(state="normal")
             self.refresh_status()